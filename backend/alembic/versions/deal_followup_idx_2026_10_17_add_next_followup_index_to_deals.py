@@ -0,0 +1,34 @@
+"""add (next_followup_date, id) index to crm_deals
+
+The deals board and the dashboard follow-up lists filter and sort deals by
+next_followup_date. The composite index lets those queries use an index
+range scan instead of scanning and sorting crm_deals, with id as a stable
+tie-breaker.
+
+Revision ID: deal_followup_idx_2026_10_17
+Revises: follow_up_2026_04_23
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "deal_followup_idx_2026_10_17"
+down_revision: Union[str, None] = "follow_up_2026_04_23"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_crm_deals_next_followup_date',
+        'crm_deals',
+        ['next_followup_date', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_crm_deals_next_followup_date', table_name='crm_deals')
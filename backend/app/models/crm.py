@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Enum, Numeric, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Enum, Numeric, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -137,6 +137,10 @@ class Deal(Base):
     # Relationships
     contact = relationship("Contact", back_populates="deals")
 
+    __table_args__ = (
+        Index("ix_crm_deals_next_followup_date", "next_followup_date", "id"),
+    )
+
     def __repr__(self):
         return f"<Deal(id={self.id}, title='{self.title}', stage={self.stage})>"
 
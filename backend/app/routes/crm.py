@@ -1,9 +1,11 @@
 import logging
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from app.database import get_db
 from app.models.crm import Contact, Deal, Interaction, ContactStatus, DealStage, InteractionType
@@ -20,6 +22,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/crm", tags=["crm"])
 
+# How far snooze/unsnooze move the next follow-up date
+_SNOOZE_DELTA = timedelta(days=3)
+
 
 # ===== Vault-sync background helpers =====
 
@@ -517,41 +522,63 @@ def delete_interaction(interaction_id: int, db: Session = Depends(get_db)):
     db.commit()
     return None
 
+def _get_deal_with_followup_count(db: Session, deal_id: int):
+    """Load a deal, its contact and its follow-up count in one SELECT."""
+    followup_count = (
+        select(func.count(Interaction.id))
+        .where(Interaction.contact_id == Deal.contact_id)
+        .where(Interaction.interaction_date >= Deal.created_at)
+        .correlate(Deal)
+        .scalar_subquery()
+    )
+    row = (
+        db.query(Deal, followup_count)
+        .options(joinedload(Deal.contact))
+        .filter(Deal.id == deal_id)
+        .first()
+    )
+    if not row:
+        raise HTTPException(status_code=404, detail="Deal not found")
+    return row[0], row[1] or 0
+
+def _set_deal_followup(db: Session, db_deal: Deal, followup_count: int, next_followup_date: date, now: datetime):
+    """Write a new follow-up date with one UPDATE ... RETURNING and build the response.
+
+    The response is built before the commit, so the commit doesn't expire
+    the loaded deal and force a refresh SELECT.
+    """
+    stmt = (
+        update(Deal)
+        .where(Deal.id == db_deal.id)
+        .values(next_followup_date=next_followup_date, updated_at=now)
+        .returning(Deal.next_followup_date, Deal.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    row = db.execute(stmt).one()
+    set_committed_value(db_deal, "next_followup_date", row.next_followup_date)
+    set_committed_value(db_deal, "updated_at", row.updated_at)
+    db_deal.followup_count = followup_count
+    response = DealResponse.model_validate(db_deal)
+    db.commit()
+    return response
+
 @router.patch("/deals/{deal_id}/snooze", response_model=DealResponse)
 def snooze_deal(
     deal_id: int,
     db: Session = Depends(get_db)
 ):
     """Snooze deal follow-up by 3 days (set next_followup_date to today + 3)"""
-    from sqlalchemy import func
-    
-    # Get deal with followup count
-    followup_count = (
-        db.query(func.count(Interaction.id))
-        .join(Deal, Deal.contact_id == Interaction.contact_id)
-        .filter(Deal.id == deal_id)
-        .filter(Interaction.interaction_date >= Deal.created_at)
-        .scalar() or 0
-    )
-    
-    db_deal = db.query(Deal).options(joinedload(Deal.contact)).filter(Deal.id == deal_id).first()
-    if not db_deal:
-        raise HTTPException(status_code=404, detail="Deal not found")
+    db_deal, followup_count = _get_deal_with_followup_count(db, deal_id)
     
     # Set next follow-up to 3 days from now
     # Add 3 days to existing next_followup_date, or set to today + 3 if not set
+    now = datetime.utcnow()
     if db_deal.next_followup_date:
-        db_deal.next_followup_date = db_deal.next_followup_date + timedelta(days=3)
+        next_followup_date = db_deal.next_followup_date + _SNOOZE_DELTA
     else:
-        db_deal.next_followup_date = (datetime.utcnow() + timedelta(days=3)).date()
-    db_deal.updated_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(db_deal)
-    
-    # Attach followup_count
-    db_deal.followup_count = followup_count
-    return db_deal
+        next_followup_date = (now + _SNOOZE_DELTA).date()
+
+    return _set_deal_followup(db, db_deal, followup_count, next_followup_date, now)
 
 @router.patch("/deals/{deal_id}/unsnooze", response_model=DealResponse)
 def unsnooze_deal(
@@ -559,32 +586,14 @@ def unsnooze_deal(
     db: Session = Depends(get_db)
 ):
     """Un-snooze deal follow-up by 3 days (subtract 3 days from next_followup_date)"""
-    from sqlalchemy import func
-    
-    # Get deal with followup count
-    followup_count = (
-        db.query(func.count(Interaction.id))
-        .join(Deal, Deal.contact_id == Interaction.contact_id)
-        .filter(Deal.id == deal_id)
-        .filter(Interaction.interaction_date >= Deal.created_at)
-        .scalar() or 0
-    )
-    
-    db_deal = db.query(Deal).options(joinedload(Deal.contact)).filter(Deal.id == deal_id).first()
-    if not db_deal:
-        raise HTTPException(status_code=404, detail="Deal not found")
+    db_deal, followup_count = _get_deal_with_followup_count(db, deal_id)
     
     # Subtract 3 days from existing next_followup_date, or set to today if not set
+    now = datetime.utcnow()
     if db_deal.next_followup_date:
-        db_deal.next_followup_date = db_deal.next_followup_date - timedelta(days=3)
+        next_followup_date = db_deal.next_followup_date - _SNOOZE_DELTA
     else:
-        db_deal.next_followup_date = datetime.utcnow().date()
-    db_deal.updated_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(db_deal)
-    
-    # Attach followup_count
-    db_deal.followup_count = followup_count
-    return db_deal
+        next_followup_date = now.date()
+
+    return _set_deal_followup(db, db_deal, followup_count, next_followup_date, now)
 
@@ -10,6 +10,9 @@ from app.services.task_parser import TaskParser
 
 router = APIRouter(prefix="/api/task-parser", tags=["tasks"])
 
+BULLET_PATTERN = re.compile(r'^[-*•]\s*')
+NUMBERED_PATTERN = re.compile(r'^\d+\.\s*')
+
 @router.post("/parse", response_model=TaskResponse, status_code=201)
 def parse_and_create_task(request: TaskParseRequest, db: Session = Depends(get_db)):
     """
@@ -22,7 +25,7 @@ def parse_and_create_task(request: TaskParseRequest, db: Session = Depends(get_d
     """
     parsed = TaskParser.parse(request.text)
 
-    db_task = Task(**parsed)
+    db_task = Task(**parsed.to_dict())
     db.add(db_task)
     db.commit()
     db.refresh(db_task)
@@ -46,9 +49,9 @@ def parse_and_create_bulk(
     def clean_line(line: str) -> str:
         line = line.strip()
         # Remove bullet points
-        line = re.sub(r'^[-*•]\s*', '', line)
+        line = BULLET_PATTERN.sub('', line)
         # Remove numbered list markers
-        line = re.sub(r'^\d+\.\s*', '', line)
+        line = NUMBERED_PATTERN.sub('', line)
         return line.strip()
 
     tasks = []
@@ -59,7 +62,7 @@ def parse_and_create_bulk(
         if cleaned:  # Skip empty lines
             try:
                 parsed = TaskParser.parse(cleaned)
-                db_task = Task(**parsed)
+                db_task = Task(**parsed.to_dict())
                 tasks.append(db_task)
             except Exception as e:
                 skipped_lines.append(f"Line {i}: {line} - {str(e)}")
@@ -1,4 +1,4 @@
-from .task_parser import TaskParser
+from .task_parser import TaskParser, ParsedTask
 from .export_service import ExportService
 
-__all__ = ["TaskParser", "ExportService"]
+__all__ = ["TaskParser", "ParsedTask", "ExportService"]
@@ -51,6 +51,32 @@ TASK_TOOLS = [
             "required": ["title"]
         }
     },
+    {
+        "name": "create_tasks",
+        "description": "Create several tasks at once in a single transaction",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "tasks": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {"type": "string", "maxLength": 255},
+                            "due_date": {"type": "string", "description": "Due date in YYYY-MM-DD format"},
+                            "priority": {
+                                "type": "string",
+                                "enum": ["LOW", "MEDIUM", "HIGH", "URGENT"],
+                                "default": "MEDIUM"
+                            }
+                        },
+                        "required": ["title"]
+                    }
+                }
+            },
+            "required": ["tasks"]
+        }
+    },
     {
         "name": "update_task",
         "description": "Update an existing task's properties",
@@ -94,7 +120,7 @@ DEAL_TOOLS = [
             "properties": {
                 "stage": {
                     "type": "string",
-                    "enum": ["lead", "prospect", "proposal", "negotiation", "closed_won", "closed_lost"],
+                    "enum": ["LEAD", "PROSPECT", "PROPOSAL", "NEGOTIATION", "CLOSED_WON", "CLOSED_LOST"],
                     "description": "Filter by deal stage"
                 },
                 "limit": {"type": "integer", "default": 10}
@@ -112,8 +138,8 @@ DEAL_TOOLS = [
                 "contact_id": {"type": "integer", "description": "Associated contact ID"},
                 "stage": {
                     "type": "string",
-                    "enum": ["lead", "prospect", "proposal", "negotiation", "closed_won", "closed_lost"],
-                    "default": "lead"
+                    "enum": ["LEAD", "PROSPECT", "PROPOSAL", "NEGOTIATION", "CLOSED_WON", "CLOSED_LOST"],
+                    "default": "LEAD"
                 }
             },
             "required": ["title"]
@@ -133,7 +159,7 @@ DEAL_TOOLS = [
                 "value": {"type": "number"},
                 "stage": {
                     "type": "string",
-                    "enum": ["lead", "prospect", "proposal", "negotiation", "closed_won", "closed_lost"]
+                    "enum": ["LEAD", "PROSPECT", "PROPOSAL", "NEGOTIATION", "CLOSED_WON", "CLOSED_LOST"]
                 }
             },
             "required": ["deal_id"]
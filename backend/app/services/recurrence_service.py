@@ -1,11 +1,28 @@
 """Service for handling recurring task logic."""
 from datetime import date, timedelta
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 
 from app.models.task import Task, TaskStatus, RecurrenceType
 
+# Map days to integers (0=Monday, 6=Sunday)
+DAY_MAP = {
+    "Mon": 0, "Tue": 1, "Wed": 2, "Thu": 3, "Fri": 4, "Sat": 5, "Sun": 6
+}
+
+
+@lru_cache(maxsize=128)
+def _recurrence_days_mask(recurrence_days: str) -> int:
+    """Parse a "Mon,Wed,Fri" string into a weekday bitmask (bit 0 = Monday)."""
+    mask = 0
+    for d in recurrence_days.split(","):
+        if d in DAY_MAP:
+            mask |= 1 << DAY_MAP[d]
+    return mask
+
 
 def calculate_next_due_date(
     current_due_date: date,
@@ -18,40 +35,25 @@ def calculate_next_due_date(
         return current_due_date + timedelta(days=interval)
     elif recurrence_type == RecurrenceType.WEEKLY:
         if recurrence_days:
-            # Map days to integers (0=Monday, 6=Sunday)
-            day_map = {
-                "Mon": 0, "Tue": 1, "Wed": 2, "Thu": 3, "Fri": 4, "Sat": 5, "Sun": 6
-            }
-            target_days = sorted([day_map[d] for d in recurrence_days.split(",") if d in day_map])
-            
-            if not target_days:
+            mask = _recurrence_days_mask(recurrence_days)
+
+            if not mask:
                 return current_due_date + timedelta(weeks=interval)
-                
+
             current_weekday = current_due_date.weekday()
-            
-            # Find next day in the same week
-            for day in target_days:
-                if day > current_weekday:
-                    days_ahead = day - current_weekday
-                    return current_due_date + timedelta(days=days_ahead)
-            
-            # If no day left in this week, go to the first day of the next interval
-            # If interval is 1, it's next week. If 2, it's 2 weeks from the start of this week?
-            # Usually "Every 2 weeks" means skip a week.
-            # So we find the first target day in the next cycle.
-            
-            # Calculate days to the first target day in the next interval
-            # First, get to the start of the next interval week (Monday)
-            # Days to next Monday = 7 - current_weekday
-            # Then add weeks for interval - 1 (since we are already moving to next week)
-            # Then add the first target day offset
-            
-            days_to_next_monday = 7 - current_weekday
-            weeks_to_skip = interval - 1
-            days_offset = days_to_next_monday + (weeks_to_skip * 7) + target_days[0]
-            
+
+            # Target days later in the same week, shifted so bit 0 is tomorrow;
+            # the lowest set bit gives the offset to the next one
+            later = mask >> (current_weekday + 1)
+            if later:
+                return current_due_date + timedelta(days=(later & -later).bit_length())
+
+            # No day left this week: move to the Monday of the next interval
+            # week (skipping interval - 1 weeks), then to the first target day.
+            first_day = (mask & -mask).bit_length() - 1
+            days_offset = (7 - current_weekday) + (interval - 1) * 7 + first_day
             return current_due_date + timedelta(days=days_offset)
-            
+
         return current_due_date + timedelta(weeks=interval)
     elif recurrence_type == RecurrenceType.MONTHLY:
         return current_due_date + relativedelta(months=interval)
@@ -79,8 +81,12 @@ def should_create_next_occurrence(task: Task) -> bool:
     return True
 
 
-def create_next_occurrence(task: Task, db: Session) -> Optional[Task]:
-    """Create the next occurrence of a recurring task."""
+def create_next_occurrence(task: Task, db: Session, refresh: bool = False) -> Optional[Task]:
+    """Create the next occurrence of a recurring task.
+
+    Pass refresh=True to reload server-populated columns (e.g. created_at)
+    immediately; otherwise they are loaded lazily on first access.
+    """
     if not should_create_next_occurrence(task):
         return None
 
@@ -107,7 +113,6 @@ def create_next_occurrence(task: Task, db: Session) -> Optional[Task]:
         due_time=task.due_time,
         priority=task.priority,
         status=TaskStatus.PENDING,
-        goal_id=task.goal_id,
         project_id=task.project_id,
         # Link to parent recurring task
         parent_task_id=task.id,
@@ -121,61 +126,86 @@ def create_next_occurrence(task: Task, db: Session) -> Optional[Task]:
     task.occurrences_created += 1
 
     db.commit()
-    db.refresh(new_task)
+    if refresh:
+        db.refresh(new_task)
 
     return new_task
 
 
-def create_all_future_occurrences(task: Task, db: Session) -> int:
+def create_all_future_occurrences(task: Task, db: Session) -> List[int]:
     """Create all future occurrences of a recurring task up to the limit.
 
     This is useful when creating a new recurring task - it will generate
     all occurrences up front instead of creating them one at a time.
 
-    Returns the number of occurrences created.
+    Returns the ids of the created occurrences.
     """
     if not task.is_recurring or not task.due_date or not task.recurrence_type:
-        return 0
+        return []
 
-    created_count = 0
+    # The due-date/end-date and is_recurring checks in
+    # should_create_next_occurrence don't change between iterations, so run
+    # them once and only track the occurrence counter inside the loop.
+    if not should_create_next_occurrence(task):
+        return []
+
+    recurrence_type = task.recurrence_type
+    interval = task.recurrence_interval or 1
+    recurrence_days = task.recurrence_days
+    max_count = task.recurrence_count
+    end_date = task.recurrence_end_date
+    occurrences_created = task.occurrences_created
+
+    # Columns copied from the parent are the same for every occurrence
+    template = {
+        "title": task.title,
+        "description": task.description,
+        "due_time": task.due_time,
+        "priority": task.priority,
+        "status": TaskStatus.PENDING,
+        "project_id": task.project_id,
+        "parent_task_id": task.id,
+        "is_recurring": False,
+    }
+
+    rows = []
     current_date = task.due_date
-    max_iterations = task.recurrence_count or 100  # Safety limit
+    max_iterations = max_count or 100  # Safety limit
 
     for i in range(max_iterations):
-        if not should_create_next_occurrence(task):
+        if max_count is not None and occurrences_created + len(rows) >= max_count:
             break
 
         next_date = calculate_next_due_date(
             current_date,
-            task.recurrence_type,
-            task.recurrence_interval or 1,
-            task.recurrence_days
+            recurrence_type,
+            interval,
+            recurrence_days
         )
 
         # Check if next date exceeds end date
-        if task.recurrence_end_date and next_date > task.recurrence_end_date:
+        if end_date and next_date > end_date:
             break
 
         # Create the occurrence
-        new_task = Task(
-            title=task.title,
-            description=task.description,
-            due_date=next_date,
-            due_time=task.due_time,
-            priority=task.priority,
-            status=TaskStatus.PENDING,
-            goal_id=task.goal_id,
-            project_id=task.project_id,
-            parent_task_id=task.id,
-            is_recurring=False,
-        )
-
-        db.add(new_task)
-        task.occurrences_created += 1
-        created_count += 1
+        rows.append({**template, "due_date": next_date})
         current_date = next_date
 
-    if created_count > 0:
-        db.commit()
+    if not rows:
+        return []
+
+    # Insert all occurrences in one statement; on backends with multi-row
+    # RETURNING this also hands back the new ids without a per-row SELECT.
+    # Elsewhere, flush ORM objects so the ids are still returned.
+    if db.get_bind().dialect.insert_executemany_returning:
+        ids = list(db.scalars(insert(Task).returning(Task.id), rows))
+    else:
+        new_tasks = [Task(**row) for row in rows]
+        db.add_all(new_tasks)
+        db.flush()
+        ids = [new_task.id for new_task in new_tasks]
+
+    task.occurrences_created = occurrences_created + len(rows)
+    db.commit()
 
-    return created_count
+    return ids
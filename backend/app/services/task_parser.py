@@ -1,9 +1,26 @@
 import re
+from dataclasses import asdict, dataclass
 from datetime import datetime, date, time, timedelta
 from typing import Optional, Dict, Any
-from dateutil import parser as date_parser
 from app.models.task import TaskPriority, TaskStatus
 
+
+@dataclass(slots=True)
+class ParsedTask:
+    """Task fields extracted from natural language text"""
+
+    title: str
+    description: Optional[str] = None
+    due_date: Optional[date] = None
+    due_time: Optional[time] = None
+    priority: TaskPriority = TaskPriority.MEDIUM
+    status: TaskStatus = TaskStatus.PENDING
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the parsed fields as Task constructor kwargs"""
+        return asdict(self)
+
+
 class TaskParser:
     """Parse natural language task descriptions"""
 
@@ -16,9 +33,20 @@ class TaskParser:
         "low": TaskPriority.LOW,
     }
 
+    # Longer keywords come first in PRIORITY_KEYWORDS, so "high priority" is
+    # matched whole rather than as "high"
+    PRIORITY_PATTERN = re.compile(
+        r'\b(' + '|'.join(re.escape(k) for k in PRIORITY_KEYWORDS) + r')\b', re.IGNORECASE
+    )
+    PRIORITY_RANK = {keyword: rank for rank, keyword in enumerate(PRIORITY_KEYWORDS)}
+
+    # Days ahead for each relative date token; None means "next occurrence
+    # of this weekday". Earlier entries take precedence.
     RELATIVE_DATES = {
         "today": 0,
         "tomorrow": 1,
+        "next week": 7,
+        "next month": 30,
         "monday": None,
         "tuesday": None,
         "wednesday": None,
@@ -27,11 +55,43 @@ class TaskParser:
         "saturday": None,
         "sunday": None,
     }
+    RELATIVE_DATE_RANK = {token: rank for rank, token in enumerate(RELATIVE_DATES)}
+
+    WEEKDAY_INDEX = {
+        "monday": 0,
+        "tuesday": 1,
+        "wednesday": 2,
+        "thursday": 3,
+        "friday": 4,
+        "saturday": 5,
+        "sunday": 6,
+    }
+
+    DATE_TOKEN_PATTERN = re.compile(
+        r'\b(?P<tok>' + '|'.join(t.replace(" ", r"\s+") for t in RELATIVE_DATES) + r')\b', re.IGNORECASE
+    )
 
     TIME_PATTERN = re.compile(r'\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\b', re.IGNORECASE)
 
+    # "YYYY-MM-DD HH:MM: " prefix used by exported task lists
+    DATETIME_PREFIX_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})\s+(\d{1,2}):(\d{2}):\s*')
+    DATE_PATTERN = re.compile(r'\b\d{4}-\d{2}-\d{2}\b')
+    FILLER_PATTERN = re.compile(r'\b(at|due|on|by)\b', re.IGNORECASE)
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+
+    @staticmethod
+    def _remove_spans(text: str, spans: list) -> str:
+        """Return text with the given sorted, non-overlapping (start, end) spans cut out"""
+        pieces = []
+        pos = 0
+        for start, end in spans:
+            pieces.append(text[pos:start])
+            pos = end
+        pieces.append(text[pos:])
+        return "".join(pieces)
+
     @classmethod
-    def parse(cls, text: str) -> Dict[str, Any]:
+    def parse(cls, text: str) -> ParsedTask:
         """
         Parse natural language text into task components.
 
@@ -42,44 +102,58 @@ class TaskParser:
         - "Review contract next Monday 2pm urgent"
         - "2025-11-11 09:00: Task title - description"
 
-        Returns dict with: title, due_date, due_time, priority, status
+        Returns a ParsedTask with: title, description, due_date, due_time,
+        priority, status
         """
-        text_lower = text.lower()
-        result = {
-            "title": text,
-            "due_date": None,
-            "due_time": None,
-            "priority": TaskPriority.MEDIUM,
-            "status": TaskStatus.PENDING,
-        }
+        # Too short to hold a keyword, time or date
+        if len(text) < 3:
+            return ParsedTask(title=text.strip() or "New Task")
+
+        result = ParsedTask(title=text)
 
         # Handle datetime prefix format: "YYYY-MM-DD HH:MM: " at start
-        datetime_prefix = re.match(r'^(\d{4}-\d{2}-\d{2})\s+(\d{1,2}):(\d{2}):\s*', text)
+        datetime_prefix = text[:4].isdigit() and cls.DATETIME_PREFIX_PATTERN.match(text)
         if datetime_prefix:
             try:
                 # Extract date
-                result["due_date"] = date_parser.parse(datetime_prefix.group(1)).date()
+                result.due_date = date.fromisoformat(datetime_prefix.group(1))
                 # Extract time
                 hour = int(datetime_prefix.group(2))
                 minute = int(datetime_prefix.group(3))
-                result["due_time"] = time(hour=hour, minute=minute)
+                result.due_time = time(hour=hour, minute=minute)
                 # Remove datetime prefix from text
-                text = text[datetime_prefix.end():].strip()
-                text_lower = text.lower()
-            except:
+                text = text[datetime_prefix.end():]
+            except ValueError:
                 pass
 
-        # Extract priority
-        for keyword, priority in cls.PRIORITY_KEYWORDS.items():
-            if keyword in text_lower:
-                result["priority"] = priority
-                # Remove priority keyword from title
-                text = re.sub(re.escape(keyword), "", text, flags=re.IGNORECASE).strip()
-                break
+        # Every pattern below scans the same text; the matched spans are
+        # collected and cut out of the title in one pass at the end
+        spans = []
+
+        # Extract priority - one scan finds every keyword, the earliest entry
+        # in PRIORITY_KEYWORDS wins
+        priority_matches = list(cls.PRIORITY_PATTERN.finditer(text))
+        if priority_matches:
+            keyword = min(
+                (m.group(1).lower() for m in priority_matches),
+                key=cls.PRIORITY_RANK.__getitem__,
+            )
+            result.priority = cls.PRIORITY_KEYWORDS[keyword]
+            spans.extend(m.span() for m in priority_matches if m.group(1).lower() == keyword)
+
+        # Times and ISO dates need digits; skip both regexes when there are none
+        has_digit = any(ch.isdigit() for ch in text)
+
+        # Find an absolute date first so its digits aren't read as a time
+        date_match = has_digit and "-" in text and cls.DATE_PATTERN.search(text)
 
         # Extract time
-        time_match = cls.TIME_PATTERN.search(text)
-        if time_match:
+        time_matches = [
+            m for m in cls.TIME_PATTERN.finditer(text)
+            if not (date_match and m.start() < date_match.end() and m.end() > date_match.start())
+        ] if has_digit else []
+        if time_matches:
+            time_match = time_matches[0]
             hour = int(time_match.group(1))
             minute = int(time_match.group(2)) if time_match.group(2) else 0
             am_pm = time_match.group(3).lower() if time_match.group(3) else None
@@ -90,62 +164,59 @@ class TaskParser:
             elif am_pm == "am" and hour == 12:
                 hour = 0
 
-            result["due_time"] = time(hour=hour, minute=minute)
-            # Remove time from title
-            text = cls.TIME_PATTERN.sub("", text).strip()
+            try:
+                result.due_time = time(hour=hour, minute=minute)
+            except ValueError:
+                pass
+            spans.extend(m.span() for m in time_matches)
 
-        # Extract date - try relative dates first
+        # Extract date - one scan finds every relative date token, the
+        # earliest entry in RELATIVE_DATES wins
         today = date.today()
-
-        if "today" in text_lower:
-            result["due_date"] = today
-            text = re.sub(r'\btoday\b', "", text, flags=re.IGNORECASE).strip()
-        elif "tomorrow" in text_lower:
-            result["due_date"] = today + timedelta(days=1)
-            text = re.sub(r'\btomorrow\b', "", text, flags=re.IGNORECASE).strip()
-        else:
-            # Check for day of week
-            weekdays = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-            for i, day in enumerate(weekdays):
-                if day in text_lower:
-                    # Find next occurrence of this weekday
-                    days_ahead = i - today.weekday()
-                    if days_ahead <= 0:  # Target day already happened this week
-                        days_ahead += 7
-                    result["due_date"] = today + timedelta(days=days_ahead)
-                    text = re.sub(rf'\b{day}\b', "", text, flags=re.IGNORECASE).strip()
-                    break
-
-            # Try "next week", "next month"
-            if "next week" in text_lower:
-                result["due_date"] = today + timedelta(days=7)
-                text = re.sub(r'\bnext week\b', "", text, flags=re.IGNORECASE).strip()
-            elif "next month" in text_lower:
-                result["due_date"] = today + timedelta(days=30)
-                text = re.sub(r'\bnext month\b', "", text, flags=re.IGNORECASE).strip()
-
-            # Try absolute date parsing (e.g., "2024-01-15", "Jan 15")
-            if not result["due_date"]:
-                try:
-                    # Try to find a date in the text
-                    date_match = re.search(r'\b\d{4}-\d{2}-\d{2}\b', text)
-                    if date_match:
-                        parsed_date = date_parser.parse(date_match.group()).date()
-                        result["due_date"] = parsed_date
-                        text = text.replace(date_match.group(), "").strip()
-                except:
-                    pass
+        date_tokens = [
+            (" ".join(m.group("tok").lower().split()), m.span())
+            for m in cls.DATE_TOKEN_PATTERN.finditer(text)
+        ]
+
+        if date_tokens:
+            token = min((tok for tok, _ in date_tokens), key=cls.RELATIVE_DATE_RANK.__getitem__)
+            days_ahead = cls.RELATIVE_DATES[token]
+            spans.extend(span for tok, span in date_tokens if tok == token)
+
+            if days_ahead is None:
+                # Next occurrence of this weekday, 1-7 days ahead (a week
+                # from today if it is today)
+                days_ahead = (cls.WEEKDAY_INDEX[token] - today.weekday()) % 7 or 7
+            elif token in ("next week", "next month"):
+                # "next week" overrides a weekday, but the weekday is still
+                # dropped from the title
+                weekday_span = next((span for tok, span in date_tokens if tok in cls.WEEKDAY_INDEX), None)
+                if weekday_span:
+                    spans.append(weekday_span)
+
+            result.due_date = today + timedelta(days=days_ahead)
+        elif not result.due_date and date_match:
+            # Try absolute date parsing (e.g., "2024-01-15")
+            try:
+                result.due_date = date.fromisoformat(date_match.group())
+                spans.append(date_match.span())
+            except ValueError:
+                pass
 
         # Clean up title - remove "at", "due", "on" if they're hanging
-        text = re.sub(r'\b(at|due|on|by)\b', "", text, flags=re.IGNORECASE)
-        text = re.sub(r'\s+', ' ', text).strip()  # Collapse multiple spaces
+        spans.extend(m.span() for m in cls.FILLER_PATTERN.finditer(text))
+
+        # None of the patterns can overlap (words vs. digits, and times
+        # inside the date are skipped), so the spans can be cut in one pass
+        text = cls._remove_spans(text, sorted(spans))
+        text = cls.WHITESPACE_PATTERN.sub(' ', text).strip()  # Collapse multiple spaces
 
         # Split on " - " to separate title and description
         if " - " in text:
             parts = text.split(" - ", 1)  # Split only on first occurrence
-            result["title"] = parts[0].strip()
-            result["description"] = parts[1].strip()
+            result.title = parts[0].strip()
+            result.description = parts[1].strip()
         else:
-            result["title"] = text if text else "New Task"
+            result.title = text if text else "New Task"
 
         return result
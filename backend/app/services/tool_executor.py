@@ -1,12 +1,13 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
-from datetime import datetime
+from datetime import date, datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, lambda_stmt, select
 
 from app.models.task import Task
-from app.models.crm import Deal, Contact
+from app.models.crm import Deal, Contact, DealStage
 from app.models.project import Project
 from app.models.outreach import OutreachCampaign, OutreachProspect, ProspectStatus
 from app.models.autoresearch import Experiment
@@ -20,63 +21,89 @@ logger = logging.getLogger(__name__)
 _vault_search_service = VaultSearchService()
 
 
+@lru_cache(maxsize=1024)
+def _parse_due_date(value: str) -> date:
+    """Parse a tool-supplied due date (YYYY-MM-DD, or a full ISO datetime).
+
+    Raises ValueError if the string is not ISO formatted.
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value).date()
+
+
 class ToolExecutor:
+    # Map tool names to handler method names
+    _HANDLERS = {
+        # Tasks
+        "get_tasks": "_get_tasks",
+        "create_task": "_create_task",
+        "create_tasks": "_create_tasks_bulk",
+        "update_task": "_update_task",
+        "delete_task": "_delete_task",
+        # Deals
+        "get_deals": "_get_deals",
+        "create_deal": "_create_deal",
+        "update_deal": "_update_deal",
+        # Contacts
+        "get_contacts": "_get_contacts",
+        "create_contact": "_create_contact",
+        # Projects
+        "get_projects": "_get_projects",
+        "create_project": "_create_project",
+        # Vault
+        "search_vault": "_search_vault",
+        "write_vault_file": "_write_vault_file",
+        "read_vault_file": "_read_vault_file",
+        "list_vault_files": "_list_vault_files",
+        # Outreach
+        "get_outreach_stats": "_get_outreach_stats",
+        "get_prospect_info": "_get_prospect_info",
+    }
+
     def __init__(self, db: Session):
         self.db = db
 
     def execute(self, tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool call and return results"""
 
-        # Map tool names to methods
-        handlers = {
-            # Tasks
-            "get_tasks": self._get_tasks,
-            "create_task": self._create_task,
-            "update_task": self._update_task,
-            "delete_task": self._delete_task,
-            # Deals
-            "get_deals": self._get_deals,
-            "create_deal": self._create_deal,
-            "update_deal": self._update_deal,
-            # Contacts
-            "get_contacts": self._get_contacts,
-            "create_contact": self._create_contact,
-            # Projects
-            "get_projects": self._get_projects,
-            "create_project": self._create_project,
-            # Vault
-            "search_vault": self._search_vault,
-            "write_vault_file": self._write_vault_file,
-            "read_vault_file": self._read_vault_file,
-            "list_vault_files": self._list_vault_files,
-            # Outreach
-            "get_outreach_stats": self._get_outreach_stats,
-            "get_prospect_info": self._get_prospect_info,
-        }
-
-        handler = handlers.get(tool_name)
-        if not handler:
+        method_name = self._HANDLERS.get(tool_name)
+        if method_name is None:
             return {"error": f"Unknown tool: {tool_name}"}
 
         try:
-            return handler(tool_input)
+            return getattr(self, method_name)(tool_input)
         except Exception as e:
             return {"error": str(e)}
 
+    def _fetch_limited(self, stmt, limit: int) -> list:
+        """Apply the row limit and run a cached lambda statement.
+
+        Large pages are streamed in batches of 100 rows.
+        """
+        stmt += lambda s: s.limit(limit)
+        options = {"yield_per": 100} if limit > 100 else {}
+        return self.db.execute(stmt, execution_options=options).all()
+
     # ------------------------------------------------------------------
     # Task tools
     # ------------------------------------------------------------------
 
     def _get_tasks(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        query = self.db.query(Task)
+        # Only the columns the tool result needs, as lightweight rows. The
+        # lambda statements cache their compiled SQL per filter combination.
+        stmt = lambda_stmt(lambda: select(Task.id, Task.title, Task.status, Task.priority, Task.due_date))
 
         if "status" in params:
-            query = query.filter(Task.status == params["status"])
+            status = params["status"]
+            stmt += lambda s: s.where(Task.status == status)
         if "priority" in params:
-            query = query.filter(Task.priority == params["priority"])
+            priority = params["priority"]
+            stmt += lambda s: s.where(Task.priority == priority)
 
         limit = params.get("limit", 10)
-        tasks = query.limit(limit).all()
+        tasks = self._fetch_limited(stmt, limit)
 
         return {
             "tasks": [
@@ -100,22 +127,48 @@ class ToolExecutor:
 
         if "due_date" in params:
             try:
-                task.due_date = datetime.strptime(params["due_date"], "%Y-%m-%d").date()
+                task.due_date = _parse_due_date(params["due_date"])
             except ValueError:
-                # Try ISO format just in case
+                return {"error": f"Invalid date format: {params['due_date']}. Use YYYY-MM-DD"}
+
+        # flush() assigns the id; read what we need before commit expires it
+        self.db.add(task)
+        self.db.flush()
+        task_id, task_title = task.id, task.title
+        self.db.commit()
+
+        return {
+            "success": True,
+            "task_id": task_id,
+            "message": f"Created task: {task_title}"
+        }
+
+    def _create_tasks_bulk(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        rows = []
+        for item in params["tasks"]:
+            row = {
+                "title": item["title"],
+                "priority": item.get("priority", "MEDIUM"),
+                "status": "PENDING",
+            }
+            if "due_date" in item:
                 try:
-                    task.due_date = datetime.fromisoformat(params["due_date"]).date()
+                    row["due_date"] = _parse_due_date(item["due_date"])
                 except ValueError:
-                    return {"error": f"Invalid date format: {params['due_date']}. Use YYYY-MM-DD"}
+                    return {"error": f"Invalid date format: {item['due_date']}. Use YYYY-MM-DD"}
+            rows.append(row)
 
-        self.db.add(task)
+        if not rows:
+            return {"error": "No tasks provided"}
+
+        # One executemany INSERT and one commit for the whole batch
+        self.db.bulk_insert_mappings(Task, rows)
         self.db.commit()
-        self.db.refresh(task)
 
         return {
             "success": True,
-            "task_id": task.id,
-            "message": f"Created task: {task.title}"
+            "created": len(rows),
+            "message": f"Created {len(rows)} tasks"
         }
 
     def _update_task(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -130,7 +183,7 @@ class ToolExecutor:
                 setattr(task, field, params[field])
 
         if "due_date" in params:
-            task.due_date = datetime.strptime(params["due_date"], "%Y-%m-%d").date()
+            task.due_date = _parse_due_date(params["due_date"])
 
         self.db.commit()
 
@@ -159,13 +212,14 @@ class ToolExecutor:
     # ------------------------------------------------------------------
 
     def _get_deals(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        query = self.db.query(Deal)
+        stmt = lambda_stmt(lambda: select(Deal.id, Deal.title, Deal.value, Deal.stage))
 
         if "stage" in params:
-            query = query.filter(Deal.stage == params["stage"])
+            stage = params["stage"]
+            stmt += lambda s: s.where(Deal.stage == stage)
 
         limit = params.get("limit", 10)
-        deals = query.limit(limit).all()
+        deals = self._fetch_limited(stmt, limit)
 
         return {
             "deals": [
@@ -183,18 +237,19 @@ class ToolExecutor:
         deal = Deal(
             title=params["title"],
             value=params.get("value", 0),
-            stage=params.get("stage", "lead"),
+            stage=params.get("stage", DealStage.LEAD),
             contact_id=params.get("contact_id")
         )
 
         self.db.add(deal)
+        self.db.flush()
+        deal_id, deal_title = deal.id, deal.title
         self.db.commit()
-        self.db.refresh(deal)
 
         return {
             "success": True,
-            "deal_id": deal.id,
-            "message": f"Created deal: {deal.title}"
+            "deal_id": deal_id,
+            "message": f"Created deal: {deal_title}"
         }
 
     def _update_deal(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -222,16 +277,16 @@ class ToolExecutor:
     # ------------------------------------------------------------------
 
     def _get_contacts(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        query = self.db.query(Contact)
+        stmt = lambda_stmt(lambda: select(Contact.id, Contact.name, Contact.email, Contact.company))
 
         if "search" in params:
             search = f"%{params['search']}%"
-            query = query.filter(
+            stmt += lambda s: s.where(
                 (Contact.name.ilike(search)) | (Contact.email.ilike(search))
             )
 
         limit = params.get("limit", 10)
-        contacts = query.limit(limit).all()
+        contacts = self._fetch_limited(stmt, limit)
 
         return {
             "contacts": [
@@ -254,13 +309,14 @@ class ToolExecutor:
         )
 
         self.db.add(contact)
+        self.db.flush()
+        contact_id, contact_name = contact.id, contact.name
         self.db.commit()
-        self.db.refresh(contact)
 
         return {
             "success": True,
-            "contact_id": contact.id,
-            "message": f"Created contact: {contact.name}"
+            "contact_id": contact_id,
+            "message": f"Created contact: {contact_name}"
         }
 
     # ------------------------------------------------------------------
@@ -292,13 +348,14 @@ class ToolExecutor:
         )
 
         self.db.add(project)
+        self.db.flush()
+        project_id, project_name = project.id, project.name
         self.db.commit()
-        self.db.refresh(project)
 
         return {
             "success": True,
-            "project_id": project.id,
-            "message": f"Created project: {project.name}"
+            "project_id": project_id,
+            "message": f"Created project: {project_name}"
         }
 
     # ------------------------------------------------------------------
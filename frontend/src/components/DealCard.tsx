@@ -1,4 +1,5 @@
 import { useState } from 'react';
+import { addDays, format, parseISO } from 'date-fns';
 import { Draggable } from '@hello-pangea/dnd';
 import { Edit, Trash2, Plus, Timer } from 'lucide-react';
 import { Deal, Contact } from '@/types';
@@ -35,18 +36,58 @@ export default function DealCard({ deal, index, contacts, onEdit, onDelete, onAd
   const [showDeleteConfirm, setShowDeleteConfirm] = useState(false);
   const queryClient = useQueryClient();
 
+  // Optimistically shift next_followup_date in the cached deals list so the
+  // board doesn't refetch every deal on each snooze click
+  const shiftFollowUp = async (id: number, days: number) => {
+    await queryClient.cancelQueries({ queryKey: ['deals'] });
+    const previousDeals = queryClient.getQueryData<Deal[]>(['deals']);
+
+    queryClient.setQueryData<Deal[]>(['deals'], (old) =>
+      old?.map((d) =>
+        d.id === id
+          ? {
+              ...d,
+              // Mirrors the API: shift an existing date, otherwise start from today
+              next_followup_date: format(
+                d.next_followup_date
+                  ? addDays(parseISO(d.next_followup_date), days)
+                  : addDays(new Date(), Math.max(days, 0)),
+                'yyyy-MM-dd'
+              ),
+            }
+          : d
+      )
+    );
+
+    return { previousDeals };
+  };
+
+  const rollbackFollowUp = (context?: { previousDeals?: Deal[] }) => {
+    if (context?.previousDeals) {
+      queryClient.setQueryData(['deals'], context.previousDeals);
+    }
+  };
+
+  // Patch the one deal with the server's copy instead of refetching the list
+  const applyFollowUp = (updated: Deal) => {
+    queryClient.setQueryData<Deal[]>(['deals'], (old) =>
+      old?.map((d) => (d.id === updated.id ? updated : d))
+    );
+    queryClient.invalidateQueries({ queryKey: ['deals', 'all'] });
+  };
+
   const snoozeMutation = useMutation({
     mutationFn: (id: number) => dealApi.snooze(id),
-    onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['deals'] });
-    },
+    onMutate: (id) => shiftFollowUp(id, 3),
+    onError: (_err, _id, context) => rollbackFollowUp(context),
+    onSuccess: applyFollowUp,
   });
 
   const unsnoozeMutation = useMutation({
     mutationFn: (id: number) => dealApi.unsnooze(id),
-    onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['deals'] });
-    },
+    onMutate: (id) => shiftFollowUp(id, -3),
+    onError: (_err, _id, context) => rollbackFollowUp(context),
+    onSuccess: applyFollowUp,
   });
 
   return (
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """
-Script to update DealCard.tsx with NextFollowUpBadge and snooze functionality
+Script to update DealCard.tsx with NextFollowUpBadge and snooze/unsnooze functionality
 """
+import os
+import re
+import sys
 
 # Read the file
 with open('src/components/DealCard.tsx', 'r', encoding='utf-8') as f:
@@ -18,9 +21,9 @@ import FollowUpBadge from './FollowUpBadge';
 import NextFollowUpBadge from './NextFollowUpBadge';
 import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { dealApi } from '@/lib/api';
-import { Timer } from 'lucide-react';"""
+import { Timer } from 'lucide-react';
+import { addDays, format, parseISO } from 'date-fns';"""
 
-content = content.replace(old_imports, new_imports)
 
 # Add snooze mutation after daysInStage (after line 25)
 old_component_start = """export default function DealCard({ deal, index, contacts, onEdit, onDelete, onAddInteraction }: DealCardProps) {
@@ -32,16 +35,62 @@ new_component_start = """export default function DealCard({ deal, index, contact
   const daysInStage = getDaysInStage(deal.updated_at);
   const queryClient = useQueryClient();
 
+  // Optimistically shift next_followup_date in the cached deals list so the
+  // board doesn't refetch every deal on each snooze click
+  const shiftFollowUp = async (id: number, days: number) => {
+    await queryClient.cancelQueries({ queryKey: ['deals'] });
+    const previousDeals = queryClient.getQueryData<Deal[]>(['deals']);
+
+    queryClient.setQueryData<Deal[]>(['deals'], (old) =>
+      old?.map((d) =>
+        d.id === id
+          ? {
+              ...d,
+              // Mirrors the API: shift an existing date, otherwise start from today
+              next_followup_date: format(
+                d.next_followup_date
+                  ? addDays(parseISO(d.next_followup_date), days)
+                  : addDays(new Date(), Math.max(days, 0)),
+                'yyyy-MM-dd'
+              ),
+            }
+          : d
+      )
+    );
+
+    return { previousDeals };
+  };
+
+  const rollbackFollowUp = (context?: { previousDeals?: Deal[] }) => {
+    if (context?.previousDeals) {
+      queryClient.setQueryData(['deals'], context.previousDeals);
+    }
+  };
+
+  // Patch the one deal with the server's copy instead of refetching the list
+  const applyFollowUp = (updated: Deal) => {
+    queryClient.setQueryData<Deal[]>(['deals'], (old) =>
+      old?.map((d) => (d.id === updated.id ? updated : d))
+    );
+    queryClient.invalidateQueries({ queryKey: ['deals', 'all'] });
+  };
+
   const snoozeMutation = useMutation({
     mutationFn: (id: number) => dealApi.snooze(id),
-    onSuccess: () => {
-      queryClient.invalidateQueries({ queryKey: ['deals'] });
-    },
+    onMutate: (id) => shiftFollowUp(id, 3),
+    onError: (_err, _id, context) => rollbackFollowUp(context),
+    onSuccess: applyFollowUp,
+  });
+
+  const unsnoozeMutation = useMutation({
+    mutationFn: (id: number) => dealApi.unsnooze(id),
+    onMutate: (id) => shiftFollowUp(id, -3),
+    onError: (_err, _id, context) => rollbackFollowUp(context),
+    onSuccess: applyFollowUp,
   });
 
   return ("""
 
-content = content.replace(old_component_start, new_component_start)
 
 # Update the follow-up badge section (lines 91-107)
 old_badge_section = """          {/* Follow-up badge with add button */}
@@ -84,6 +133,18 @@ new_badge_section = """          {/* Follow-up badges with actions */}
                   Add
                 </button>
               )}
+              <button
+                onClick={(e) => {
+                  e.stopPropagation();
+                  unsnoozeMutation.mutate(deal.id);
+                }}
+                disabled={unsnoozeMutation.isPending}
+                className="flex-1 px-2 py-1 text-xs bg-amber-50 text-amber-600 hover:bg-amber-100 rounded flex items-center justify-center gap-1 transition-colors disabled:opacity-50"
+                title="Move closer by 3 days"
+              >
+                <Timer className="w-3 h-3" />
+                -3d
+              </button>
               <button
                 onClick={(e) => {
                   e.stopPropagation();
@@ -99,10 +160,37 @@ new_badge_section = """          {/* Follow-up badges with actions */}
             </div>
           </div>"""
 
-content = content.replace(old_badge_section, new_badge_section)
+# Apply all three replacements in a single scan of the file
+replacements = {
+    old_imports: new_imports,
+    old_component_start: new_component_start,
+    old_badge_section: new_badge_section,
+}
+
+# Code each replacement adds. old_imports is a prefix of new_imports, so the
+# old anchors alone can't tell whether the card was already updated.
+applied_markers = [
+    "import NextFollowUpBadge from './NextFollowUpBadge';",
+    "const snoozeMutation = useMutation(",
+    "<NextFollowUpBadge date={deal.next_followup_date} />",
+]
+applied = [marker for marker in applied_markers if marker in content]
+if len(applied) == len(applied_markers):
+    # Already applied - don't rewrite the file and trigger a rebuild
+    print("SKIP: DealCard.tsx is already up to date")
+    sys.exit(0)
+if applied:
+    sys.exit(f"ERROR: DealCard.tsx is partly updated (found {applied}); fix it by hand")
+
+pattern = re.compile('|'.join(re.escape(old) for old in replacements))
+content, count = pattern.subn(lambda m: replacements[m.group(0)], content)
+if count != len(replacements):
+    sys.exit(f"ERROR: Expected {len(replacements)} replacements, made {count}; DealCard.tsx not written")
 
-# Write back
-with open('src/components/DealCard.tsx', 'w', encoding='utf-8') as f:
+# Write back via a temp file so a failed run can't leave DealCard.tsx half-written
+tmp_path = 'src/components/DealCard.tsx.tmp'
+with open(tmp_path, 'w', encoding='utf-8') as f:
     f.write(content)
+os.replace(tmp_path, 'src/components/DealCard.tsx')
 
-print("SUCCESS: Updated DealCard.tsx with NextFollowUpBadge and snooze button")
+print("SUCCESS: Updated DealCard.tsx with NextFollowUpBadge and snooze/unsnooze buttons")